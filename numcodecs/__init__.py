@@ -124,6 +124,11 @@ register_codec(CRC32)
 register_codec(Adler32)
 register_codec(JenkinsLookup3)
 
+with suppress(ImportError):
+    from numcodecs.checksum32 import CRC32C
+
+    register_codec(CRC32C)
+
 from numcodecs.json import JSON
 
 register_codec(JSON)
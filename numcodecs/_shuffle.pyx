@@ -8,7 +8,7 @@ cimport cython
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-cpdef void _doShuffle(const unsigned char[::1] src, unsigned char[::1] des, Py_ssize_t element_size) noexcept nogil:
+cdef void _shuffle_impl(const unsigned char[::1] src, unsigned char[::1] des, Py_ssize_t element_size) noexcept nogil:
     cdef Py_ssize_t count, i, j, offset, byte_index
     count = len(src) // element_size
     for i in range(count):
@@ -20,7 +20,7 @@ cpdef void _doShuffle(const unsigned char[::1] src, unsigned char[::1] des, Py_s
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-cpdef void _doUnshuffle(const unsigned char[::1] src, unsigned char[::1] des, Py_ssize_t element_size) noexcept nogil:
+cdef void _unshuffle_impl(const unsigned char[::1] src, unsigned char[::1] des, Py_ssize_t element_size) noexcept nogil:
     cdef Py_ssize_t count, i, j, offset, byte_index
     count = len(src) // element_size
     for i in range(element_size):
@@ -28,3 +28,15 @@ cpdef void _doUnshuffle(const unsigned char[::1] src, unsigned char[::1] des, Py
         for byte_index in range(count):
             j = byte_index*element_size + i
             des[j] = src[offset+byte_index]
+
+
+cpdef void _doShuffle(const unsigned char[::1] src, unsigned char[::1] des, Py_ssize_t element_size):
+    # release the GIL while shuffling so other threads can run (or shuffle)
+    # concurrently
+    with nogil:
+        _shuffle_impl(src, des, element_size)
+
+
+cpdef void _doUnshuffle(const unsigned char[::1] src, unsigned char[::1] des, Py_ssize_t element_size):
+    with nogil:
+        _unshuffle_impl(src, des, element_size)
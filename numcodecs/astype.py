@@ -1,9 +1,30 @@
+from contextlib import suppress
+
 import numpy as np
 
 from .abc import Codec
 from .compat import ndarray_copy, ensure_ndarray
 
 
+def _resolve_dtype(dtype):
+    """Resolve `dtype` via numpy, falling back to extension dtypes (e.g. the
+    float8 and bfloat16 variants from ml_dtypes) which are only resolvable by
+    name once the package providing them has been imported."""
+    try:
+        return np.dtype(dtype)
+    except TypeError:
+        with suppress(ImportError):
+            import ml_dtypes  # noqa: F401
+        return np.dtype(dtype)
+
+
+def _dtype_repr(dtype):
+    # extension dtypes report a generic void .str, only their name round-trips
+    if dtype.kind == 'V':
+        return dtype.name
+    return dtype.str
+
+
 class AsType(Codec):
     """Filter to convert data between different types.
 
@@ -21,6 +42,13 @@ class AsType(Codec):
     No checks are made to ensure the casting will work in that direction and
     data corruption will occur.
 
+    If the optional ml_dtypes package is installed, its extension dtypes
+    (e.g. ``"float8_e4m3fn"``, ``"bfloat16"``) may also be used as
+    `encode_dtype`, halving or quartering the stored bytes relative to
+    float16/float32 at a corresponding loss of precision. Data should be
+    scaled into the narrow type's range beforehand, e.g. via
+    :class:`numcodecs.fixedscaleoffset.FixedScaleOffset`.
+
     Examples
     --------
     >>> import numcodecs
@@ -41,8 +69,8 @@ class AsType(Codec):
     codec_id = 'astype'
 
     def __init__(self, encode_dtype, decode_dtype):
-        self.encode_dtype = np.dtype(encode_dtype)
-        self.decode_dtype = np.dtype(decode_dtype)
+        self.encode_dtype = _resolve_dtype(encode_dtype)
+        self.decode_dtype = _resolve_dtype(decode_dtype)
 
     def encode(self, buf):
         # normalise input
@@ -68,11 +96,11 @@ class AsType(Codec):
     def get_config(self):
         return {
             'id': self.codec_id,
-            'encode_dtype': self.encode_dtype.str,
-            'decode_dtype': self.decode_dtype.str,
+            'encode_dtype': _dtype_repr(self.encode_dtype),
+            'decode_dtype': _dtype_repr(self.decode_dtype),
         }
 
     def __repr__(self):
         return '{}(encode_dtype={!r}, decode_dtype={!r})'.format(
-            type(self).__name__, self.encode_dtype.str, self.decode_dtype.str
+            type(self).__name__, _dtype_repr(self.encode_dtype), _dtype_repr(self.decode_dtype)
         )
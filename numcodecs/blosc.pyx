@@ -215,7 +215,7 @@ def err_bad_cname(cname):
 
 
 def compress(source, char* cname, int clevel, int shuffle=SHUFFLE,
-             int blocksize=AUTOBLOCKS):
+             int blocksize=AUTOBLOCKS, int nthreads=1):
     """Compress data.
 
     Parameters
@@ -234,6 +234,10 @@ def compress(source, char* cname, int clevel, int shuffle=SHUFFLE,
     blocksize : int
         The requested size of the compressed blocks.  If 0, an automatic blocksize will
         be used.
+    nthreads : int
+        Number of threads blosc may use internally when the global (threaded)
+        context is unavailable, e.g. when called from a worker thread. The
+        default is 1.
 
     Returns
     -------
@@ -305,7 +309,7 @@ def compress(source, char* cname, int clevel, int shuffle=SHUFFLE,
             with nogil:
                 cbytes = blosc_compress_ctx(clevel, shuffle, itemsize, nbytes, source_ptr,
                                             dest_ptr, nbytes + BLOSC_MAX_OVERHEAD,
-                                            cname, blocksize, 1)
+                                            cname, blocksize, nthreads)
 
     finally:
 
@@ -322,7 +326,7 @@ def compress(source, char* cname, int clevel, int shuffle=SHUFFLE,
     return dest
 
 
-def decompress(source, dest=None):
+def decompress(source, dest=None, int nthreads=1):
     """Decompress data.
 
     Parameters
@@ -332,6 +336,10 @@ def decompress(source, dest=None):
         protocol.
     dest : array-like, optional
         Object to decompress into.
+    nthreads : int
+        Number of threads blosc may use internally when the global (threaded)
+        context is unavailable, e.g. when called from a worker thread. The
+        default is 1.
 
     Returns
     -------
@@ -380,7 +388,7 @@ def decompress(source, dest=None):
                 ret = blosc_decompress(source_ptr, dest_ptr, nbytes)
         else:
             with nogil:
-                ret = blosc_decompress_ctx(source_ptr, dest_ptr, nbytes, 1)
+                ret = blosc_decompress_ctx(source_ptr, dest_ptr, nbytes, nthreads)
 
     finally:
 
@@ -531,6 +539,13 @@ class Blosc(Codec):
     blocksize : int
         The requested size of the compressed blocks.  If 0 (default), an automatic
         blocksize will be used.
+    nthreads : int, optional
+        Number of threads blosc may use internally per encode/decode call when
+        the shared global context cannot be used, i.e., when running outside
+        the main thread. The default of 1 preserves the previous behaviour;
+        raising it trades CPU for lower per-chunk latency on large chunks.
+        This is a process-local tuning knob that affects no encoded byte and
+        is therefore not part of the codec configuration.
 
     See Also
     --------
@@ -545,7 +560,8 @@ class Blosc(Codec):
     AUTOSHUFFLE = AUTOSHUFFLE
     max_buffer_size = 2**31 - 1
 
-    def __init__(self, cname='lz4', clevel=5, shuffle=SHUFFLE, blocksize=AUTOBLOCKS):
+    def __init__(self, cname='lz4', clevel=5, shuffle=SHUFFLE, blocksize=AUTOBLOCKS,
+                 nthreads=1):
         self.cname = cname
         if isinstance(cname, str):
             self._cname_bytes = cname.encode('ascii')
@@ -554,14 +570,18 @@ class Blosc(Codec):
         self.clevel = clevel
         self.shuffle = shuffle
         self.blocksize = blocksize
+        # underscore-prefixed so this process-local tuning knob stays out of
+        # get_config() and the serialized array metadata
+        self._nthreads = nthreads
 
     def encode(self, buf):
         buf = ensure_contiguous_ndarray(buf, self.max_buffer_size)
-        return compress(buf, self._cname_bytes, self.clevel, self.shuffle, self.blocksize)
+        return compress(buf, self._cname_bytes, self.clevel, self.shuffle, self.blocksize,
+                        self._nthreads)
 
     def decode(self, buf, out=None):
         buf = ensure_contiguous_ndarray(buf, self.max_buffer_size)
-        return decompress(buf, out)
+        return decompress(buf, out, self._nthreads)
 
     def decode_partial(self, buf, int start, int nitems, out=None):
         '''**Experimental**'''
@@ -569,10 +589,13 @@ class Blosc(Codec):
         return decompress_partial(buf, start, nitems, dest=out)
 
     def __repr__(self):
-        r = '%s(cname=%r, clevel=%r, shuffle=%s, blocksize=%s)' % \
+        r = '%s(cname=%r, clevel=%r, shuffle=%s, blocksize=%s' % \
             (type(self).__name__,
              self.cname,
              self.clevel,
              _shuffle_repr[self.shuffle + 1],
              self.blocksize)
+        if self._nthreads != 1:
+            r += ', nthreads=%s' % self._nthreads
+        r += ')'
         return r
@@ -88,11 +88,18 @@ class FixedScaleOffset(Codec):
         # flatten to simplify implementation
         arr = arr.reshape(-1, order='A')
 
-        # compute scale offset
-        enc = (arr - self.offset) * self.scale
+        # compute scale offset, scaling in place when the result type allows
+        # it to avoid materializing an intermediate array per operation
+        enc = arr - self.offset
+        if np.result_type(enc.dtype, type(self.scale)) == enc.dtype:
+            enc *= self.scale
+        else:
+            # in-place multiply would require an unsafe cast, e.g. integer
+            # data scaled by a float
+            enc = enc * self.scale
 
         # round to nearest integer
-        enc = np.around(enc)
+        np.around(enc, out=enc)
 
         # convert dtype
         enc = enc.astype(self.astype, copy=False)
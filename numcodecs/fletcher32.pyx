@@ -3,13 +3,17 @@
 # cython: cdivision=True
 import struct
 
+cimport cython
+
 from numcodecs.abc import Codec
 from numcodecs.compat import ensure_contiguous_ndarray
 
 from libc.stdint cimport uint8_t, uint16_t, uint32_t
 
 
-cdef uint32_t _fletcher32(const uint8_t[::1] _data):
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef uint32_t _fletcher32(const uint8_t[::1] _data) noexcept nogil:
     # converted from
     # https://github.com/Unidata/netcdf-c/blob/main/plugins/H5checksum.c#L109
     cdef:
@@ -64,14 +68,24 @@ class Fletcher32(Codec):
         """Return buffer plus 4-byte fletcher checksum"""
         buf = ensure_contiguous_ndarray(buf).ravel().view('uint8')
         cdef const uint8_t[::1] b_ptr = buf
-        val = _fletcher32(b_ptr)
-        return buf.tobytes() + struct.pack("<I", val)
+        cdef uint32_t val
+        # the checksum loop needs no Python objects, so let other threads run
+        with nogil:
+            val = _fletcher32(b_ptr)
+        # assemble the output in a single pass, avoiding the extra
+        # allocation and copy of tobytes() followed by concatenation
+        enc = bytearray(buf.nbytes + 4)
+        enc[:-4] = buf.data
+        struct.pack_into("<I", enc, buf.nbytes, val)
+        return enc
 
     def decode(self, buf, out=None):
         """Check fletcher checksum, and return buffer without it"""
         b = ensure_contiguous_ndarray(buf).view('uint8')
         cdef const uint8_t[::1] b_ptr = b[:-4]
-        val = _fletcher32(b_ptr)
+        cdef uint32_t val
+        with nogil:
+            val = _fletcher32(b_ptr)
         found = b[-4:].view("<u4")[0]
         if val != found:
             raise RuntimeError(
@@ -42,20 +42,13 @@ class PackBits(Codec):
 
         # determine size of packed data
         n = arr.size
-        n_bytes_packed = n // 8
-        n_bits_leftover = n % 8
-        if n_bits_leftover > 0:
-            n_bytes_packed += 1
+        n_bytes_packed = (n + 7) // 8
 
         # setup output
         enc = np.empty(n_bytes_packed + 1, dtype='u1')
 
-        # store how many bits were padded
-        if n_bits_leftover:
-            n_bits_padded = 8 - n_bits_leftover
-        else:
-            n_bits_padded = 0
-        enc[0] = n_bits_padded
+        # store how many bits were padded to complete the final byte
+        enc[0] = -n % 8
 
         # apply encoding
         enc[1:] = np.packbits(arr)
@@ -72,12 +65,8 @@ class PackBits(Codec):
         # find out how many bits were padded
         n_bits_padded = int(enc[0])
 
-        # apply decoding
-        dec = np.unpackbits(enc[1:])
-
-        # remove padded bits
-        if n_bits_padded:
-            dec = dec[:-n_bits_padded]
+        # apply decoding, stripping any padded bits in the same pass
+        dec = np.unpackbits(enc[1:], count=-n_bits_padded if n_bits_padded else None)
 
         # view as boolean array
         dec = dec.view(bool)
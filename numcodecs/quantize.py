@@ -59,11 +59,8 @@ class Quantize(Codec):
         if self.dtype.kind != 'f' or self.astype.kind != 'f':
             raise ValueError('only floating point data types are supported')
 
-    def encode(self, buf):
-        # normalise input
-        arr = ensure_ndarray(buf).view(self.dtype)
-
-        # apply scaling
+        # compute scale; this only depends on digits, so do it once here
+        # rather than on every call to encode
         precision = 10.0**-self.digits
         exp = math.log(precision, 10)
         if exp < 0:
@@ -71,8 +68,18 @@ class Quantize(Codec):
         else:
             exp = int(math.ceil(exp))
         bits = math.ceil(math.log(10.0**-exp, 2))
-        scale = 2.0**bits
-        enc = np.around(scale * arr) / scale
+        self._scale = 2.0**bits
+
+    def encode(self, buf):
+        # normalise input
+        arr = ensure_ndarray(buf).view(self.dtype)
+
+        # apply scaling, rounding and rescaling in place to avoid
+        # materializing an intermediate array per operation
+        scale = self._scale
+        enc = scale * arr
+        np.around(enc, out=enc)
+        enc /= scale
 
         # cast dtype
         enc = enc.astype(self.astype, copy=False)
@@ -2,6 +2,7 @@
 applications to dynamically register and look-up codec classes."""
 
 from importlib.metadata import entry_points
+import functools
 import logging
 
 logger = logging.getLogger("numcodecs")
@@ -38,9 +39,24 @@ def get_codec(config):
     >>> codec
     Zlib(level=1)
 
+    Notes
+    -----
+    Codecs obtained for equal configurations may be cached and shared, so
+    the returned instance should not be mutated.
+
     """
-    config = dict(config)
-    codec_id = config.pop('id', None)
+    # build the id-less config in a single pass rather than copying and
+    # then popping, which allocates twice
+    codec_id = config.get('id')
+    config = {k: v for k, v in config.items() if k != 'id'}
+    try:
+        return _get_codec_cached(codec_id, tuple(sorted(config.items())))
+    except TypeError:
+        # configuration contains unhashable values, cannot be cached
+        return _get_codec(codec_id, config)
+
+
+def _get_codec(codec_id, config):
     cls = codec_registry.get(codec_id)
     if cls is None:
         if codec_id in entries:
@@ -52,6 +68,11 @@ def get_codec(config):
     raise ValueError('codec not available: %r' % codec_id)
 
 
+@functools.lru_cache(maxsize=256)
+def _get_codec_cached(codec_id, config_items):
+    return _get_codec(codec_id, dict(config_items))
+
+
 def register_codec(cls, codec_id=None):
     """Register a codec class.
 
@@ -70,3 +91,5 @@ def register_codec(cls, codec_id=None):
         codec_id = cls.codec_id
     logger.debug("Registering codec '%s'", codec_id)
     codec_registry[codec_id] = cls
+    # drop any instances cached for a previously registered class
+    _get_codec_cached.cache_clear()
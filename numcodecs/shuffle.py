@@ -23,7 +23,9 @@ class Shuffle(Codec):
         buf = ensure_contiguous_ndarray(buf)
 
         if out is None:
-            out = np.zeros(buf.nbytes, dtype='uint8')
+            # no need to zero-initialize, the output buffer is always
+            # written in full by the shuffle kernels or the copy below
+            out = np.empty(buf.nbytes, dtype='uint8')
         else:
             out = ensure_contiguous_ndarray(out)
 
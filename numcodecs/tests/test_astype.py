@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 from numpy.testing import assert_array_equal
 
 
@@ -58,6 +59,20 @@ def test_repr():
     check_repr("AsType(encode_dtype='<i4', decode_dtype='<i2')")
 
 
+def test_float8():
+    ml_dtypes = pytest.importorskip("ml_dtypes")
+    encode_dtype = np.dtype(ml_dtypes.float8_e4m3fn)
+    codec = AsType(encode_dtype='float8_e4m3fn', decode_dtype='<f4')
+    assert codec.encode_dtype == encode_dtype
+    arr = np.linspace(0, 1, 100, dtype='<f4')
+    enc = codec.encode(arr)
+    assert encode_dtype == enc.dtype
+    dec = codec.decode(enc)
+    assert_array_equal(arr.astype(encode_dtype).astype('<f4'), dec)
+    check_config(codec)
+    check_repr("AsType(encode_dtype='float8_e4m3fn', decode_dtype='<f4')")
+
+
 def test_backwards_compatibility():
     # integers
     arrs = [
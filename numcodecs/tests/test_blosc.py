@@ -212,6 +212,23 @@ def test_config_blocksize():
     assert codec.blocksize == 2**8
 
 
+def test_config_nthreads():
+    # N.B., nthreads is a process-local tuning knob and must not appear in the
+    # config, which needs to round-trip through installs that don't accept it
+
+    codec = Blosc(cname='lz4', clevel=1, nthreads=2)
+    config = codec.get_config()
+    assert 'nthreads' not in config
+    assert codec == Blosc.from_config(config)
+
+
+def test_encode_decode_nthreads(use_threads):
+    arr = np.arange(1000, dtype='i4')
+    codec = Blosc(cname='lz4', clevel=1, nthreads=2)
+    blosc.use_threads = use_threads
+    check_encode_decode(arr, codec)
+
+
 def test_backwards_compatibility():
     check_backwards_compatibility(Blosc.codec_id, arrays, codecs)
 
@@ -6,6 +6,12 @@ import pytest
 
 
 from numcodecs.checksum32 import CRC32, Adler32
+
+try:
+    from numcodecs.checksum32 import CRC32C
+except ImportError:  # pragma: no cover
+    CRC32C = None
+
 from numcodecs.tests.common import (
     check_encode_decode,
     check_config,
@@ -27,6 +33,8 @@ arrays = [
 ]
 
 codecs = [CRC32(), Adler32()]
+if CRC32C is not None:
+    codecs.append(CRC32C())
 
 
 def test_encode_decode():
@@ -49,13 +57,27 @@ def test_config():
 def test_repr():
     check_repr("CRC32()")
     check_repr("Adler32()")
+    if CRC32C is not None:
+        check_repr("CRC32C()")
+
+
+@pytest.mark.skipif(CRC32C is None, reason="crc32c not available")
+def test_crc32c_checksum():
+    # CRC-32C check value, see RFC 3720 appendix B.4
+    arr = np.frombuffer(b'123456789', dtype='u1')
+    enc = CRC32C().encode(arr)
+    assert enc[:4].view('<u4')[0] == 0xE3069283
 
 
 def test_backwards_compatibility():
     check_backwards_compatibility(CRC32.codec_id, arrays, [CRC32()])
     check_backwards_compatibility(Adler32.codec_id, arrays, [Adler32()])
+    if CRC32C is not None:
+        check_backwards_compatibility(CRC32C.codec_id, arrays, [CRC32C()])
 
 
 def test_err_encode_object_buffer():
     check_err_encode_object_buffer(CRC32())
     check_err_encode_object_buffer(Adler32())
+    if CRC32C is not None:
+        check_err_encode_object_buffer(CRC32C())
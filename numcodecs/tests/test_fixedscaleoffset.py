@@ -50,6 +50,18 @@ def test_encode():
     assert np.dtype(astype) == actual.dtype
 
 
+def test_encode_int_dtype_float_scale():
+    # integer data with a float scale promotes during encoding
+    dtype = '<i4'
+    astype = '<i2'
+    codec = FixedScaleOffset(scale=0.5, offset=0, dtype=dtype, astype=astype)
+    arr = np.arange(100, dtype=dtype)
+    expect = np.around(arr * 0.5).astype(astype)
+    actual = codec.encode(arr)
+    assert_array_equal(expect, actual)
+    assert np.dtype(astype) == actual.dtype
+
+
 def test_config():
     codec = FixedScaleOffset(dtype='<f8', astype='<i4', scale=10, offset=100)
     check_config(codec)
@@ -3,7 +3,8 @@ import pytest
 import inspect
 
 import numcodecs
-from numcodecs.registry import get_codec
+from numcodecs.abc import Codec
+from numcodecs.registry import get_codec, register_codec
 
 
 def test_registry_errors():
@@ -11,6 +12,41 @@ def test_registry_errors():
         get_codec({'id': 'foo'})
 
 
+def test_get_codec_cached():
+    # Equal configurations share a cached instance.
+    codec = get_codec({'id': 'json2'})
+    assert get_codec({'id': 'json2'}) is codec
+
+
+def test_register_codec_clears_cache():
+    class V1(Codec):
+        codec_id = 'test_cache_eviction'
+
+        def encode(self, buf):  # pragma: no cover
+            return buf
+
+        def decode(self, buf, out=None):  # pragma: no cover
+            return buf
+
+    class V2(V1):
+        pass
+
+    register_codec(V1)
+    assert type(get_codec({'id': V1.codec_id})) is V1
+
+    # re-registering under the same id must evict instances of the old class
+    register_codec(V2, codec_id=V1.codec_id)
+    assert type(get_codec({'id': V1.codec_id})) is V2
+
+
+def test_get_codec_unhashable_config():
+    # list-valued parameters cannot be cached but must still resolve
+    config = {'id': 'categorize', 'labels': ['foo', 'bar'], 'dtype': '<U3'}
+    codec = get_codec(config)
+    assert codec == get_codec(config)
+    assert codec is not get_codec(config)
+
+
 def test_get_codec_argument():
     # Check that get_codec doesn't modify its argument.
     arg = {"id": "json2"}
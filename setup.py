@@ -14,6 +14,7 @@ cpu_info = cpuinfo.get_cpu_info()
 flags = cpu_info.get('flags', [])
 have_sse2 = 'sse2' in flags
 have_avx2 = 'avx2' in flags
+have_avx512 = all(f in flags for f in ('avx512f', 'avx512bw', 'avx512vbmi'))
 
 # MARK: - Eugo add flags for NEON and ACLE
 have_neon = 'neon' in flags
@@ -21,6 +22,7 @@ have_acle = 'acle' in flags
 
 disable_sse2 = 'DISABLE_NUMCODECS_SSE2' in os.environ
 disable_avx2 = 'DISABLE_NUMCODECS_AVX2' in os.environ
+disable_avx512 = 'DISABLE_NUMCODECS_AVX512' in os.environ
 
 # setup common compile arguments
 have_cflags = 'CFLAGS' in os.environ
@@ -29,6 +31,7 @@ if have_cflags:
     # respect compiler options set by user
     pass
 elif os.name == 'posix':
+    base_compile_args.extend(['-O3', '-funroll-loops'])
     if disable_sse2:
         base_compile_args.append('-mno-sse2')
     elif have_sse2:
@@ -37,11 +40,22 @@ elif os.name == 'posix':
         base_compile_args.append('-mno-avx2')
     elif have_avx2:
         base_compile_args.append('-mavx2')
-    # @HELP - # MARK: - Eugo add append flags for NEON and ACE
-    elif have_neon:
-        base_compile_args.append("-march=armv8-a -mtune=cortex-a72 -moutline-atomics")
-    elif have_acle:
-        base_compile_args.append("-march=armv8-a -mtune=cortex-a72 -moutline-atomics")
+    # MARK: - Eugo add flags for AVX512 (VBMI enables single-instruction byte permutes)
+    if disable_avx512:
+        base_compile_args.append('-mno-avx512f')
+    elif have_avx512:
+        base_compile_args.extend(['-mavx512f', '-mavx512bw', '-mavx512vbmi'])
+    # MARK: - Eugo add flags for NEON and ACLE
+    # N.B., must be separate argv elements; a single space-joined string is
+    # passed to the compiler as one unknown option and silently ignored.
+    # Also must not be chained onto the x86 elif ladder above, which never
+    # reached these branches when the AVX2 checks were disabled.
+    if have_neon or have_acle:
+        if have_acle:
+            base_compile_args.append('-march=armv8-a+crc')
+        else:
+            base_compile_args.append('-march=armv8-a')
+        base_compile_args.append('-moutline-atomics')
 
 # On macOS, force libc++ in case the system tries to use `stdlibc++`.
 # The latter is often absent from modern macOS systems.
@@ -123,6 +137,13 @@ def blosc_extension():
     else:
         info('compiling Blosc extension without AVX2 support')
 
+    # MARK: - AVX512
+    if have_avx512 and not disable_avx512:
+        info('compiling Blosc extension with AVX512 support')
+        extra_compile_args.append('-DSHUFFLE_AVX512_ENABLED')
+    else:
+        info('compiling Blosc extension without AVX512 support')
+
     # MARK: - NEON
     # @HELP
     if have_neon: